@@ -1,13 +1,56 @@
-import re
+from typing import Callable
+
 import ttkbootstrap as ttkb
 from ttkbootstrap.validation import validator
 
-alpha_re = re.compile('\s*[0123456789.]*[a-z, A-Z]+[0123456789.]*\s*')
-numeric_re = re.compile('\s*[0123456789.]+\s*')
+__all__ = ['month_validator', 'day_validator', 'year_validator', 'hour_validator', 'minute_validator',
+           'numeric_validator', 'not_blank_validator']
 
-@validator
-def month_validator(event: ttkb.validation.ValidationEvent) -> bool:
+_NUMERIC_CHARS = frozenset('0123456789.')
+
+
+def _int_strings(low: int, high: int) -> frozenset[str]:
     """
+    Builds the set of strings, both plain and zero-padded to two digits, that represent the integers between low
+    and high, inclusive
+
+    :param low: the lowest valid value
+    :type low: int
+    :param high: the highest valid value
+    :type high: int
+    :return: the accepted strings
+    :rtype: frozenset[str]
+
+    """
+    return frozenset(s for n in range(low, high + 1) for s in (str(n), f'{n:02d}'))
+
+
+def _make_range_validator(low: int, high: int, doc: str) -> Callable[..., bool]:
+    """
+    Creates a validator that accepts the plain or zero-padded string form of an integer between low and high,
+    inclusive.  The set of accepted strings is built once and held by the validator's closure.
+
+    :param low: the lowest valid value
+    :type low: int
+    :param high: the highest valid value
+    :type high: int
+    :param doc: the docstring for the created validator
+    :type doc: str
+    :return: the validator, decorated with ttkbootstrap.validation.validator
+    :rtype: Callable[..., bool]
+
+    """
+    valid_values: frozenset[str] = _int_strings(low, high)
+
+    def range_validator(event: ttkb.validation.ValidationEvent) -> bool:
+        return event.postchangetext in valid_values
+
+    range_validator = validator(range_validator)
+    range_validator.__doc__ = doc
+    return range_validator
+
+
+month_validator = _make_range_validator(1, 12, """
     Validates a month value to be numeric and between 1 and 12 inclusive
 
     :param event:
@@ -15,21 +58,10 @@ def month_validator(event: ttkb.validation.ValidationEvent) -> bool:
     :return: Is the value valid?
     :rtype: bool
 
-    """
-    month_str: str = event.postchangetext
-    if month_str.isnumeric():
-        month: int = int(month_str)
-        if 1 <= month <= 12:
-            return True
-        else:
-            return False
-    else:
-        return False
+    """)
 
 
-@validator
-def day_validator(event: ttkb.validation.ValidationEvent) -> bool:
-    """
+day_validator = _make_range_validator(1, 31, """
     Validates a day value to be numeric and between 1 and 31, inclusive.  A more complete validation is done in the
     :method gui.widgets.DateWidget.validate_date(event): method.
 
@@ -38,17 +70,7 @@ def day_validator(event: ttkb.validation.ValidationEvent) -> bool:
     :return: Is the value valid?
     :rtype: bool
 
-    """
-    day_str: str = event.postchangetext
-    if day_str.isnumeric():
-        day: int = int(day_str)
-        if 1 <= day <= 31:
-            return True
-        else:
-            return False
-
-    else:
-        return False
+    """)
 
 
 @validator
@@ -62,16 +84,11 @@ def year_validator(event: ttkb.validation.ValidationEvent) -> bool:
     :rtype: bool
 
     """
-    day_str: str = event.postchangetext
-    if day_str.isnumeric():
-        return True
-    else:
-        return False
+    year_str: str = event.postchangetext
+    return year_str.isascii() and year_str.isdigit()
 
 
-@validator
-def hour_validator(event: ttkb.validation.ValidationEvent) -> bool:
-    """
+hour_validator = _make_range_validator(1, 12, """
     Validate an hour value to be numeric and between 1 and 12, inclusive
 
     :param event:
@@ -79,21 +96,10 @@ def hour_validator(event: ttkb.validation.ValidationEvent) -> bool:
     :return: Is the value valid?
     :rtype: bool
 
-    """
-    hour_str: str = event.postchangetext
-    if hour_str.isnumeric():
-        hour = int(hour_str)
-        if 1 <= hour <= 12:
-            return True
-        else:
-            return False
-    else:
-        return False
+    """)
 
 
-@validator
-def minute_validator(event: ttkb.validation.ValidationEvent) -> bool:
-    """
+minute_validator = _make_range_validator(0, 59, """
     Validate a minute value to be numeric and less than or equal to 59
 
     :param event:
@@ -101,16 +107,8 @@ def minute_validator(event: ttkb.validation.ValidationEvent) -> bool:
     :return: Is the value valid?
     :rtype: bool
 
-    """
-    minute_str: str = event.postchangetext
-    if minute_str.isnumeric():
-        minute = int(minute_str)
-        if minute <= 59:
-            return True
-        else:
-            return False
-    else:
-        return False
+    """)
+
 
 @validator
 def numeric_validator(event: ttkb.validation.ValidationEvent) -> bool:
@@ -123,11 +121,8 @@ def numeric_validator(event: ttkb.validation.ValidationEvent) -> bool:
     :rtype: bool
 
     """
-    value_str: str = event.postchangetext
-    if len(value_str) > 0 and alpha_re.match(value_str) is None and numeric_re.match(value_str) is not None:
-        return True
-    else:
-        return False
+    value_str: str = event.postchangetext.strip()
+    return len(value_str) > 0 and set(value_str) <= _NUMERIC_CHARS
 
 
 @validator
@@ -142,7 +137,4 @@ def not_blank_validator(event: ttkb.validation.ValidationEvent) -> bool:
 
     """
     value_str: str = event.postchangetext
-    if len(value_str.strip()) > 0:
-        return True
-    else:
-        return False
+    return len(value_str) > 0 and not value_str.isspace()
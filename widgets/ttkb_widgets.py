@@ -1,18 +1,142 @@
 from abc import abstractmethod
+import calendar
+from collections import deque
 from datetime import datetime, date, time
 from decimal import Decimal
+from functools import lru_cache
 import re
 import tkinter as tk
+import tkinter.font as tkfont
 import ttkbootstrap as ttkb
 import ttkbootstrap.dialogs.dialogs as dialogs
 from ttkbootstrap.validation import add_validation
 from ttkbootstrap.constants import *
 
 from typing import Any, Callable, Literal, Optional, Union
+from weakref import WeakValueDictionary
 
 from widgets.ttkb_validators import month_validator, day_validator, year_validator, hour_validator, \
     minute_validator
 
+_INTEGER_REGEX_STR: str = '\\s*(\\d*)\\s*'
+_DECIMAL_REGEX_STR: str = '\\s*(\\d+[.]*\\d*)\\s*'
+
+
+@lru_cache(maxsize=128)
+def _compile(regex_str: str) -> re.Pattern:
+    """
+    Compiles a regular expression, caching the result so that widgets created with the same pattern share a single
+    compiled instance
+
+    :param regex_str: a regular expression
+    :type regex_str: str
+    :return: the compiled regular expression
+    :rtype: re.Pattern
+
+    """
+    return re.compile(regex_str)
+
+
+_INTEGER_DEFAULT_RE: re.Pattern = _compile(_INTEGER_REGEX_STR)
+_DECIMAL_DEFAULT_RE: re.Pattern = _compile(_DECIMAL_REGEX_STR)
+
+
+def _is_integer_str(str_value: str) -> bool:
+    """
+    Checks a stripped, non-blank string against the default integer pattern: one or more ASCII digits
+
+    :param str_value: the string to be checked
+    :type str_value: str
+    :return: True if the string is an unsigned integer
+    :rtype: bool
+
+    """
+    return str_value.isascii() and str_value.isdigit()
+
+
+def _is_decimal_str(str_value: str) -> bool:
+    """
+    Checks a stripped, non-blank string against the default decimal pattern: ASCII digits with at most one decimal
+    point, which may not lead
+
+    :param str_value: the string to be checked
+    :type str_value: str
+    :return: True if the string is an unsigned decimal
+    :rtype: bool
+
+    """
+    if str_value[0] == '.':
+        return False
+    digits = str_value.replace('.', '', 1)
+    return digits.isascii() and digits.isdigit()
+
+
+# keysyms of the digit keys on the main keyboard and the numeric keypad
+_DIGIT_KEYSYMS: frozenset[str] = frozenset('0123456789') | frozenset(f'KP_{digit}' for digit in range(10))
+
+def _step(var: tk.StringVar, low: int, high: int, delta: int) -> None:
+    """
+    Adds delta, 1 or -1, to the number in a date or time field, wrapping around from high to low or from low to
+    high.  If the field does not contain a number, it is set to low when stepping up and to high when stepping down.
+    The new value is written with two digits.
+
+    :param var: the StringVar of the field
+    :type var: tk.StringVar
+    :param low: the lowest value of the field
+    :type low: int
+    :param high: the highest value of the field
+    :type high: int
+    :param delta: 1 to step up, -1 to step down
+    :type delta: int
+    :return: None
+
+    """
+    try:
+        value: Optional[int] = int(var.get()) + delta
+    except ValueError:
+        value = None
+    if value is not None and low <= value <= high:
+        var.set(f'{value:02d}')
+    elif delta > 0:
+        var.set(f'{low:02d}')
+    else:
+        var.set(f'{high:02d}')
+
+
+def _no_focus() -> None:
+    """
+    The focus action used by DateWidget and TimeWidget when no previous or next entry has been set
+
+    :return: None
+
+    """
+
+
+# StringVars shared by entry widgets created with the same var_key.  A StringVar stays in the pool as long as some
+# widget or caller holds a reference to it.
+_var_pool: WeakValueDictionary[str, ttkb.StringVar] = WeakValueDictionary()
+
+
+@lru_cache(maxsize=256)
+def _label_width(text: str, min_width: int) -> int:
+    """
+    Calculates a width for a label based on the label text and a minimum width.  Results are cached, since forms
+    tend to reuse the same label text.
+
+    :param text: the label text
+    :type text: str
+    :param min_width: the minimum label width
+    :type min_width: int
+    :return: the calculated label width
+    :rtype: int
+
+    """
+    text_width = len(text) + 2
+    if text_width < min_width:
+        return min_width
+    else:
+        return text_width
+
 
 class Radiobutton(ttkb.Radiobutton):
     """
@@ -20,29 +144,39 @@ class Radiobutton(ttkb.Radiobutton):
     can tell when that can use the space bar to select or unselect a button
 
     """
+    # ttk style names resolved from the 'primary' and 'toolbutton' bootstyles by the first instance
+    _STYLE_PRIMARY: Optional[str] = None
+    _STYLE_TOOLBUTTON: Optional[str] = None
 
     def __init__(self, parent, text: str, value: str, variable: ttkb.StringVar, command=None,
                  width=None):
         ttkb.Radiobutton.__init__(self, parent, text=text, value=value, variable=variable,
                                   command=command, width=width, bootstyle='primary')
+        if Radiobutton._STYLE_TOOLBUTTON is None:
+            Radiobutton._STYLE_PRIMARY = self.cget('style')
+            self.configure(bootstyle='toolbutton')
+            Radiobutton._STYLE_TOOLBUTTON = self.cget('style')
+            self.configure(bootstyle='primary')
         self.bind('<FocusIn>', self.focus_in)
         self.bind('<FocusOut>', self.focus_out)
 
     def focus_in(self, event) -> None:
         """
-        Handler for the <FocusIn> event. Changes config parm bootstyle to 'toolbutton'
+        Handler for the <FocusIn> event. Changes config parm bootstyle to 'toolbutton'.  The style was resolved when
+        the first instance was created, so ttkbootstrap's configure override is bypassed.
         :param event:
         :return: None
         """
-        self.configure(bootstyle='toolbutton')
+        tk.Misc.configure(self, style=self._STYLE_TOOLBUTTON)
 
     def focus_out(self, event):
         """
-        Handler for the <FocusOut> event.  Changes config parm bootstyle to 'primary'
+        Handler for the <FocusOut> event.  Changes config parm bootstyle to 'primary'.  The style was resolved when
+        the first instance was created, so ttkbootstrap's configure override is bypassed.
         :param event:
         :return:
         """
-        self.configure(bootstyle='primary')
+        tk.Misc.configure(self, style=self._STYLE_PRIMARY)
 
 
 class Checkbutton(ttkb.Checkbutton):
@@ -50,10 +184,18 @@ class Checkbutton(ttkb.Checkbutton):
     Subclass of ttkbootstrap.Checkbutton that changes it appears when it is in focus, so that the user
     can tell when that can use the space bar to select or unselect a checkbox
     """
+    # ttk style names resolved from the 'primary' and 'toolbutton' bootstyles by the first instance
+    _STYLE_PRIMARY: Optional[str] = None
+    _STYLE_TOOLBUTTON: Optional[str] = None
 
     def __init__(self, parent, text, variable, command=None, padding=None, width=None):
         ttkb.Checkbutton.__init__(self, parent, text=text, variable=variable, command=command, padding=padding,
                                   width=width, bootstyle='primary')
+        if Checkbutton._STYLE_TOOLBUTTON is None:
+            Checkbutton._STYLE_PRIMARY = self.cget('style')
+            self.configure(bootstyle='toolbutton')
+            Checkbutton._STYLE_TOOLBUTTON = self.cget('style')
+            self.configure(bootstyle='primary')
         self.bind('<FocusIn>', self.focus_in)
         self.bind('<FocusOut>', self.focus_out)
         self.row: int = -1
@@ -61,27 +203,33 @@ class Checkbutton(ttkb.Checkbutton):
 
     def focus_in(self, event):
         """
-        Handler for the <FocusIn> event. Changes config parm bootstyle to 'toolbutton'
+        Handler for the <FocusIn> event. Changes config parm bootstyle to 'toolbutton'.  The style was resolved when
+        the first instance was created, so ttkbootstrap's configure override is bypassed.
         :param event:
         :return: None
         """
-        self.configure(bootstyle='toolbutton')
+        tk.Misc.configure(self, style=self._STYLE_TOOLBUTTON)
 
     def focus_out(self, event):
         """
-        Handler for the <FocusOut> event.  Changes config parm bootstyle to 'primary'
+        Handler for the <FocusOut> event.  Changes config parm bootstyle to 'primary'.  The style was resolved when
+        the first instance was created, so ttkbootstrap's configure override is bypassed.
         :param event:
         :return:
         """
-        self.configure(bootstyle='primary')
+        tk.Misc.configure(self, style=self._STYLE_PRIMARY)
 
 
 class EntryWidget:
     """
     An abstract base class for entry label/widget pairs
     """
+    # ttk style names resolved from the 'default' and 'danger' bootstyles the first time an entry fails validation
+    _STYLE_VALID: Optional[str] = None
+    _STYLE_INVALID: Optional[str] = None
 
-    def __init__(self, parent, label_text: Optional[str], entry_width: int, regex_str: Optional[str] = None):
+    def __init__(self, parent, label_text: Optional[str], entry_width: int, regex_str: Optional[str] = None,
+                 var_key: Optional[str] = None):
         """
         Create an instance of EntryWidget
 
@@ -89,28 +237,73 @@ class EntryWidget:
         :param label_text: the text to be used in creating the label
         :type label_text: str`
         :param regex_str:
+        :param var_key: if not None, the entry uses the pooled StringVar registered under this key, creating it if
+            necessary, so that the variable can be reused when a dialog is reopened
+        :type var_key: str
         """
         self.parent = parent
         self.label_text = label_text
         if regex_str is not None:
-            self.regex_pattern: Optional[re.Pattern] = re.compile(regex_str)
+            self.regex_pattern: Optional[re.Pattern] = _compile(regex_str)
         else:
             self.regex_pattern = None
-        self.strvar = ttkb.StringVar()
+        if var_key is None:
+            self.strvar = ttkb.StringVar()
+        else:
+            self.strvar = _var_pool.get(var_key)
+            if self.strvar is None:
+                self.strvar = ttkb.StringVar()
+                _var_pool[var_key] = self.strvar
         self.entry = ttkb.Entry(master=parent, textvariable=self.strvar, validate='focusout', width=entry_width,
-                                validatecommand=self.validate, invalidcommand=self.invalid)
+                                validatecommand=self._validate_command, invalidcommand=self.invalid)
+        # the pattern, string and groups of the most recent apply_regex call
+        self._last_match: Optional[tuple[re.Pattern, str, Optional[tuple[Any, ...]]]] = None
+        self._is_invalid: bool = False
+
+    def _validate_command(self) -> int:
+        """
+        The 'validatecommand' callback.  Delegates to validate, and calls valid when the value passes
+
+        :return: 1 if valid, 0 if not
+        :rtype: int
+
+        """
+        if self.validate():
+            self.valid()
+            return 1
+        else:
+            return 0
 
     def invalid(self):
         """
-        This method is used as an 'invalidcommand' callback.  It is invoked when validation fails.  It sets the widget
-        background color to red, which gives it a red border, then calls focus_set on the widget
+        This method is used as an 'invalidcommand' callback.  It is invoked when validation fails.  It switches the
+        entry to the 'danger' style, which gives it a red border, then calls focus_set on the widget.  The style name
+        is resolved the first time any entry fails validation, so ttkbootstrap's configure override is bypassed after
+        that.
 
         :return: None
 
         """
-        self.entry.config(background='red')
+        if EntryWidget._STYLE_INVALID is None:
+            EntryWidget._STYLE_VALID = self.entry.cget('style')
+            self.entry.configure(bootstyle='danger')
+            EntryWidget._STYLE_INVALID = self.entry.cget('style')
+        else:
+            tk.Misc.configure(self.entry, style=EntryWidget._STYLE_INVALID)
+        self._is_invalid = True
         self.focus_set()
 
+    def valid(self):
+        """
+        Called when validation succeeds.  Restores the entry's default style if it was marked invalid
+
+        :return: None
+
+        """
+        if self._is_invalid:
+            tk.Misc.configure(self.entry, style=EntryWidget._STYLE_VALID)
+            self._is_invalid = False
+
     def focus_set(self):
         """
         Delegates focus_set calls to the entry widget
@@ -147,7 +340,7 @@ class EntryWidget:
         :return: None
 
         """
-        self.entry.grid(kwargs)
+        self.entry.grid(**kwargs)
 
     def set_regex(self, regex_str: str) -> None:
         """
@@ -158,11 +351,12 @@ class EntryWidget:
         :return: None
 
         """
-        self.regex_pattern = re.compile(regex_str)
+        self.regex_pattern = _compile(regex_str)
 
     def apply_regex(self, value=None) -> Optional[tuple[Any, ...]]:
         """
-        Apply the widget's regex either to the proved string or to the value entered to the widget prompt
+        Apply the widget's regex either to the proved string or to the value entered to the widget prompt.  The result
+        of the most recent call is kept, so validating and then getting the same value runs the regex only once.
 
         :param value: if not None, the regex will be applied to this value
         :type value: str
@@ -171,14 +365,38 @@ class EntryWidget:
 
         """
         if value is None:
-            match = self.regex_pattern.match(self.strvar.get())
-        else:
-            match = self.regex_pattern.match(value)
+            value = self.strvar.get()
+        last_match = self._last_match
+        if last_match is not None and last_match[0] is self.regex_pattern and last_match[1] == value:
+            return last_match[2]
 
+        match = self.regex_pattern.match(value)
         if match is None:
+            groups = None
+        else:
+            groups = match.groups()
+        self._last_match = (self.regex_pattern, value, groups)
+        return groups
+
+    def apply_regex_one(self, value=None) -> Optional[str]:
+        """
+        Apply the widget's regex either to the provided string or to the value entered to the widget prompt, and
+        return the single group collected by the regex
+
+        :param value: if not None, the regex will be applied to this value
+        :type value: str
+        :return: the group collected by the regex, or None if the value does not match or the regex does not have
+            exactly one group
+        :rtype: Optional[str]
+
+        """
+        if self.regex_pattern.groups != 1:
+            return None
+        groups = self.apply_regex(value)
+        if groups is None:
             return None
         else:
-            return match.groups()
+            return groups[0]
 
     def get_var(self) -> ttkb.StringVar:
         """
@@ -235,7 +453,8 @@ class TextWidget(EntryWidget):
 
     """
 
-    def __init__(self, parent, label_text: str, entry_width: int, regex_str: Optional[str] = None):
+    def __init__(self, parent, label_text: str, entry_width: int, regex_str: Optional[str] = None,
+                 var_key: Optional[str] = None):
         """
         Creates and instance of TextWidget
 
@@ -245,9 +464,27 @@ class TextWidget(EntryWidget):
         :type label_text: str
         :param regex_str: The regular expression that will be used to validate data entered to the widget
         :type regex_str: str
+        :param var_key: if not None, the key of a pooled StringVar to be shared with other entry widgets
+        :type var_key: str
+
+        """
+        EntryWidget.__init__(self, parent=parent, label_text=label_text, entry_width=entry_width, regex_str=regex_str,
+                             var_key=var_key)
+
+    def _is_valid(self, value: str) -> bool:
+        """
+        Checks a value entered to the widget.  Callers pass the value so that the StringVar is read only once.
+
+        :param value: the value to be checked
+        :type value: str
+        :return: True if the value is blank or valid
+        :rtype: bool
 
         """
-        EntryWidget.__init__(self, parent=parent, label_text=label_text, entry_width=entry_width, regex_str=regex_str)
+        if self.regex_pattern is None or len(value.strip()) == 0:
+            return True
+        else:
+            return self.apply_regex_one(value) is not None
 
     def validate(self) -> int:
         """
@@ -257,18 +494,10 @@ class TextWidget(EntryWidget):
         :rtype: int
 
         """
-        if self.regex_pattern is not None:
-            str_value = self.strvar.get().strip()
-            if len(str_value) > 0:
-                groups = self.apply_regex()
-                if groups is not None and len(groups) == 1:
-                    return 1
-                else:
-                    return 0
-            else:
-                return 1
-        else:
+        if self._is_valid(self.strvar.get()):
             return 1
+        else:
+            return 0
 
     def get_value(self):
         """
@@ -291,25 +520,47 @@ class TextWidget(EntryWidget):
 
         """
         if self.regex_pattern is not None:
-            groups = self.apply_regex(value)
-            if groups is None:
+            group = self.apply_regex_one(value)
+            if group is None:
                 raise ValueError(f'{value} is not a valid {self.label_text}')
             else:
-                self.strvar.set(groups[0])
+                self.strvar.set(group)
         else:
             self.strvar.set(value)
 
 
-class LabeledTextWidget:
+def _normalize_grid_args(label_grid_args: dict[str, Any], entry_grid_args: dict[str, Any]) -> str:
+    """
+    If the label and entry are gridded on the same row and no sticky value was given for the entry, the entry is made
+    to stick to the west side of its cell, and the label text is anchored on the east, so the two sit together
+
+    :param label_grid_args: the arguments to be used in gridding the label
+    :type label_grid_args: dict[str, Any]
+    :param entry_grid_args: the arguments to be used in gridding the entry widget.  A sticky value may be added.
+    :type entry_grid_args: dict[str, Any]
+    :return: the anchor to be used for the label text
+    :rtype: str
+
+    """
+    if 'row' in label_grid_args and 'row' in entry_grid_args and 'sticky' not in entry_grid_args:
+        if label_grid_args['row'] == entry_grid_args['row']:
+            entry_grid_args['sticky'] = tk.W
+            return tk.E
+    return tk.W
+
+
+class _LabeledEntry:
     """
-    A Frame containing a Label and a TextWidget
+    A base class for label/entry widget pairs.  Subclasses set _ENTRY_CLS to the entry widget class to be created.
 
     """
+    _ENTRY_CLS: type[EntryWidget] = EntryWidget
 
     def __init__(self, parent, label_text: str, label_width: int, label_grid_args: dict[str, Any],
-                 entry_width: int, entry_grid_args: dict[str, Any], regex_str: Optional[str] = None):
+                 entry_width: int, entry_grid_args: dict[str, Any], regex_str: Optional[str] = None,
+                 var_key: Optional[str] = None, lazy: bool = False):
         """
-        Creates and instance of LabeledTextWidget
+        Creates and instance of the labeled widget
 
         :param parent: The GUI parent for this Frame
         :param label_text: the text to be used in creating the label
@@ -322,21 +573,62 @@ class LabeledTextWidget:
         :type entry_width: int
         :param entry_grid_args: the arguments to be used in gridding the entry widet
         :type entry_grid_args: dict[str, Any]
-        :param regex_str: the regular expression to be used for validation of input: default '\\s*(\\w*)\\s*'
+        :param regex_str: the regular expression to be used for validation of input.  If None, the entry widget's
+            default is used
         :type regex_str: str
+        :param var_key: if not None, the key of a pooled StringVar to be shared with other entry widgets
+        :type var_key: str
+        :param lazy: if True, creation of the label and entry widgets is deferred until the widget is gridded, put in
+            focus, bound, or has its value read or set
+        :type lazy: bool
+
+        """
+        self.label: Optional[ttkb.Label] = None
+        self.entry: Optional[EntryWidget] = None
+        self._pending: Optional[dict[str, Any]] = dict(parent=parent, label_text=label_text, label_width=label_width,
+                                                        label_grid_args=label_grid_args, entry_width=entry_width,
+                                                        entry_grid_args=entry_grid_args, regex_str=regex_str,
+                                                        var_key=var_key)
+        if not lazy:
+            self._materialize()
+
+    def _materialize(self) -> None:
+        """
+        Creates and grids the label and entry widgets, unless that has already been done
+
+        :return: None
 
         """
-        # ttkb.Frame.__init__(self, master=parent)
-        anchor = tk.W
-        if 'row' in label_grid_args and 'row' in entry_grid_args and 'sticky' not in entry_grid_args:
-            if label_grid_args['row'] == entry_grid_args['row']:
-                entry_grid_args['sticky'] = tk.W
-                anchor = tk.E
+        if self._pending is not None:
+            pending = self._pending
+            self._pending = None
+            self._create(**pending)
+
+    def _create(self, parent, label_text: str, label_width: int, label_grid_args: dict[str, Any], entry_width: int,
+                entry_grid_args: dict[str, Any], regex_str: Optional[str], var_key: Optional[str]) -> None:
+        """
+        Creates and grids the label and entry widgets, using the arguments provided to the constructor
+
+        :return: None
+
+        """
+        anchor = _normalize_grid_args(label_grid_args, entry_grid_args)
         self.label = ttkb.Label(master=parent, text=label_text, width=label_width, anchor=anchor)
         self.label.grid(**label_grid_args)
-        self.entry = TextWidget(parent=parent, label_text=label_text, entry_width=entry_width, regex_str=regex_str)
+        self.entry = self._ENTRY_CLS(parent=parent, label_text=label_text, entry_width=entry_width,
+                                     regex_str=regex_str, var_key=var_key)
         self.entry.grid(**entry_grid_args)
 
+    def grid(self) -> None:
+        """
+        Creates the label and entry widgets, if their creation was deferred.  The widgets are gridded using the grid
+        arguments provided to the constructor.
+
+        :return: None
+
+        """
+        self._materialize()
+
     def focus_set(self):
         """
         Delegates calls to focus_set to the entry widget
@@ -344,6 +636,7 @@ class LabeledTextWidget:
         :return: None
 
         """
+        self._materialize()
         self.entry.focus_set()
 
     def bind(self, sequence: str | None = ...,
@@ -361,28 +654,30 @@ class LabeledTextWidget:
         :return: None
 
         """
+        self._materialize()
         return self.entry.bind(sequence, func, add)
 
-    def get_value(self) -> str:
+    def get_value(self) -> Any:
         """
         Return the widget's entry value
 
-        :return: the widget's entry value
-        :rtype: str
+        :return: the widget's entry value, as returned by the entry widget's get_value method
+        :rtype: Any
 
         """
+        self._materialize()
         return self.entry.get_value()
 
-    def set_value(self, value: str) -> None:
+    def set_value(self, value: Any) -> None:
         """
-        The argument value is filtered through the validation regex and the resulting regex group is used to set the
-        widget's entry value
+        Delegates set_value calls to the entry widget, which checks the value and uses it to set the entry value
 
         :param value: the value to be used to set the entry value
-        :type value: str
+        :type value: Any
         :return: None
 
         """
+        self._materialize()
         self.entry.set_value(value)
 
     @staticmethod
@@ -398,15 +693,20 @@ class LabeledTextWidget:
         :rtype: int
 
         """
-        text_width = len(text) + 2
-        if text_width < min_width:
-            return min_width
-        else:
-            return text_width
+        return _label_width(text, min_width)
+
+
+class LabeledTextWidget(_LabeledEntry):
+    """
+    A Label and a TextWidget.  If no regular expression is provided, input is not validated.
+
+    """
+    _ENTRY_CLS = TextWidget
 
 
 class IntegerWidget(EntryWidget):
-    def __init__(self, parent, label_text: str, regex_str: Optional[str] = '\\s*(\\d*)\\s*'):
+    def __init__(self, parent, label_text: str, regex_str: Optional[str] = None, var_key: Optional[str] = None,
+                 entry_width: int = 10):
         """
         Creates and instance of IntegerWidget
 
@@ -416,9 +716,46 @@ class IntegerWidget(EntryWidget):
         :type label_text: str
         :param regex_str: The regular expression used to validate data entered: default '\\s*(\\d*)\\s*'
         :type regex_str: str
+        :param var_key: if not None, the key of a pooled StringVar to be shared with other entry widgets
+        :type var_key: str
+        :param entry_width: the width of the entry widget: default 10
+        :type entry_width: int
+
+        """
+        EntryWidget.__init__(self, parent=parent, label_text=label_text, entry_width=entry_width, regex_str=regex_str,
+                             var_key=var_key)
+        if regex_str is None:
+            self.regex_pattern = _INTEGER_DEFAULT_RE
+
+    def _uses_default_regex(self) -> bool:
+        """
+        Is the widget using the default integer pattern?  Values checked against the default pattern are validated
+        with string methods rather than the regular expression.
+
+        :return: True if the default pattern is in use
+        :rtype: bool
+
+        """
+        return self.regex_pattern is _INTEGER_DEFAULT_RE
+
+    def _is_valid(self, value: str) -> bool:
+        """
+        Checks a value entered to the widget.  Callers pass the value so that the StringVar is read only once.
+
+        :param value: the value to be checked
+        :type value: str
+        :return: True if the value is blank or valid
+        :rtype: bool
 
         """
-        EntryWidget.__init__(self, parent=parent, label_text=label_text, entry_width=10, regex_str=regex_str)
+        str_value = value.strip()
+        if len(str_value) == 0:
+            return True
+        elif self._uses_default_regex():
+            return _is_integer_str(str_value)
+        else:
+            group = self.apply_regex_one(value)
+            return group is not None and group.isnumeric()
 
     def validate(self):
         """
@@ -428,18 +765,10 @@ class IntegerWidget(EntryWidget):
         :rtype: int
 
         """
-        str_value = self.strvar.get().strip()
-        if len(str_value) > 0:
-            groups = self.apply_regex()
-            if groups is not None and len(groups) == 1:
-                if groups[0].isnumeric():
-                    return 1
-                else:
-                    return 0
-            else:
-                return 0
-        else:
+        if self._is_valid(self.strvar.get()):
             return 1
+        else:
+            return 0
 
     def get_value(self):
         """
@@ -453,12 +782,12 @@ class IntegerWidget(EntryWidget):
         if len(value) == 0:
             return 0
         else:
-            return int(self.strvar.get().strip())
+            return int(value)
 
     def set_value(self, value: Union[int, str]):
         """
-        The argument value is filtered through the validation regex and the resulting regex group is used to set the
-        widget's entry value
+        The argument value is checked to be an unsigned integer, or blank for zero, and is used to set the widget's
+        entry value
 
         :param value: the value to be used to set the entry value
         :type value: Union[int, str]
@@ -467,133 +796,77 @@ class IntegerWidget(EntryWidget):
         """
         if isinstance(value, int):
             self.strvar.set(f'{value:d}')
-        elif isinstance(value, str) and value.isnumeric():
-            if len(value.strip()) > 0:
-                re_groups = self.apply_regex(value)
-                int_value: int = int(re_groups[0])
-                self.strvar.set(f'{int_value:d}')
-            else:
+        elif isinstance(value, str):
+            str_value = value.strip()
+            if len(str_value) == 0:
                 self.strvar.set('0')
+            elif _is_integer_str(str_value):
+                self.strvar.set(str_value)
+            else:
+                raise ValueError(f'{value} is not a valid {self.label_text}')
         else:
             raise ValueError(f'{value} is not a valid {self.label_text}')
 
 
-class LabeledIntegerWidget:
-    def __init__(self, parent, label_text: str, label_width: int, label_grid_args: dict[str, Any],
-                 entry_width: int, entry_grid_args: dict[str, Any], regex_str: Optional[str] = '\\s*(\\d*)\\s*'):
-        """
-        Creates and instance of LabeledIntegerWidget
-
-        :param parent: The GUI parent for this Frame
-        :param label_text: the text to be used in creating the label
-        :type label_text: str
-        :param label_width: the width to be used in creating the label
-        :type label_width: int
-        :param label_grid_args: the arguments to be used in gridding the label
-        :type label_grid_args: dict[str, Any]
-        :param entry_width: the width to be used in creating the entry widget
-        :type entry_width: int
-        :param entry_grid_args: the arguments to be used in gridding the entry widet
-        :type entry_grid_args: dict[str, Any]
-        :param regex_str: the regular expression to be used for validation of input: default value '\\s*(\\d*)\\s*'
-        :type regex_str: str
-
-        """
-        # ttkb.Frame.__init__(self, master=parent)
-        row_str: str = 'row'
-        sticky_str: str = 'sticky'
-        anchor = tk.W
-        if row_str in label_grid_args and row_str in entry_grid_args and sticky_str not in entry_grid_args:
-            if label_grid_args[row_str] == entry_grid_args[row_str]:
-                anchor = tk.E
-                entry_grid_args[sticky_str] = tk.W
-        self.label = ttkb.Label(master=parent, text=label_text, width=label_width, anchor=anchor)
-        self.label.grid(**label_grid_args)
-        self.entry = IntegerWidget(parent=parent, label_text=label_text, regex_str=regex_str)
-        self.entry.grid(**entry_grid_args)
-
-    def focus_set(self):
-        """
-        Delegates calls to focus_set to the entry widget
-
-        :return: None
-
-        """
-        self.entry.focus_set()
-
-    def bind(self, sequence: str | None = ...,
-             func: Callable[[tk.Event], Any] | None = ...,
-             add: Literal["", "+"] | bool | None = ..., ) -> str:
-        """
-        Delegate bind calls to the entry widget
+class LabeledIntegerWidget(_LabeledEntry):
+    """
+    A Label and an IntegerWidget.  The default regular expression is '\\s*(\\d*)\\s*'
 
-        :param sequence: the name of the event to be bound
-        :type sequence: str | None
-        :param func: the callback to be invoked when the event is captured
-        :type func: Callable[[tk.Event], Any]
-        :param add: allows multiple bindings for single event
-        :type add: Literal["", "+"] | bool | None
-        :return: None
+    """
+    _ENTRY_CLS = IntegerWidget
 
-        """
-        return self.entry.bind(sequence, func, add)
 
-    def get_value(self) -> int:
+class DecimalWidget(EntryWidget):
+    def __init__(self, parent, label_text: str, regex_str: Optional[str] = None, var_key: Optional[str] = None,
+                 entry_width: int = 10):
         """
-        Return the widget's entry value
+        Creates and instance of DecimalWidget
 
-        :return: the widget's entry value as an integer
-        :rtype: int
+        :param parent: the GUI parent of this widget
+        :param label_text: the text for the label that will be associated with the widget.  The label is not
+            created with the entry widget, but the label text is used to create ValueError exception messages
+        :type label_text: str
+        :param regex_str: The regular expression used to validate data entered: default '\\s*(\\d+[.]*\\d*)\\s*'
+        :type regex_str: str
+        :param var_key: if not None, the key of a pooled StringVar to be shared with other entry widgets
+        :type var_key: str
+        :param entry_width: the width of the entry widget: default 10
+        :type entry_width: int
 
         """
-        return self.entry.get_value()
+        EntryWidget.__init__(self, parent=parent, label_text=label_text, entry_width=entry_width, regex_str=regex_str,
+                             var_key=var_key)
+        if regex_str is None:
+            self.regex_pattern = _DECIMAL_DEFAULT_RE
 
-    def set_value(self, value: Union[int, str]) -> None:
+    def _uses_default_regex(self) -> bool:
         """
-        The argument value is filtered through the validation regex and the resulting regex group is used to set the
-        widget's entry value
+        Is the widget using the default decimal pattern?  Values checked against the default pattern are validated
+        with string methods rather than the regular expression.
 
-        :param value: the value to be used to set the entry value
-        :type value: Union[int, str]
-        :return: None
+        :return: True if the default pattern is in use
+        :rtype: bool
 
         """
-        self.entry.set_value(value)
+        return self.regex_pattern is _DECIMAL_DEFAULT_RE
 
-    @staticmethod
-    def label_width(text: str, min_width: int) -> int:
+    def _is_valid(self, value: str) -> bool:
         """
-        Calculates a width for the label based on the label text and a minumum width
+        Checks a value entered to the widget.  Callers pass the value so that the StringVar is read only once.
 
-        :param text: the label test
-        :type text: str
-        :param min_width: the minimum label width
-        :type min_width: int
-        :return: the calculated label width
-        :rtype: int
+        :param value: the value to be checked
+        :type value: str
+        :return: True if the value is blank or valid
+        :rtype: bool
 
         """
-        text_width = len(text) + 2
-        if text_width < min_width:
-            return min_width
+        str_value = value.strip()
+        if len(str_value) == 0:
+            return True
+        elif self._uses_default_regex():
+            return _is_decimal_str(str_value)
         else:
-            return text_width
-
-
-class DecimalWidget(EntryWidget):
-    def __init__(self, parent, label_text: str, regex_str: Optional[str] = '\\s*(\\d+[.]*\\d*)\\s*'):
-        """
-        Creates and instance of DecimalWidget
-
-        :param parent: the GUI parent of this widget
-        :param label_text: the text for the label that will be associated with the widget.  The label is not
-            created with the entry widget, but the label text is used to create ValueError exception messages
-        :type label_text: str
-        :param regex_str: The regular expression used to validate data entered: default '\\s*(\\d+[.]*\\d*)\\s*'
-        :type regex_str: str
-
-        """
-        EntryWidget.__init__(self, parent=parent, label_text=label_text, entry_width=10, regex_str=regex_str)
+            return self.apply_regex_one(value) is not None
 
     def validate(self):
         """
@@ -603,15 +876,10 @@ class DecimalWidget(EntryWidget):
         :rtype: int
 
         """
-        str_value = self.strvar.get().strip()
-        if len(str_value) > 0:
-            groups = self.apply_regex()
-            if groups is not None and len(groups) == 1:
-                return 1
-            else:
-                return 0
-        else:
+        if self._is_valid(self.strvar.get()):
             return 1
+        else:
+            return 0
 
     def get_value(self) -> Decimal:
         """
@@ -621,14 +889,15 @@ class DecimalWidget(EntryWidget):
         :rtype: decimal.Decimal
 
         """
-        if self.validate() == 1:
-            str_value = self.strvar.get().strip()
+        value = self.strvar.get()
+        if self._is_valid(value):
+            str_value = value.strip()
             if len(str_value) == 0:
                 return Decimal(0)
             else:
                 return Decimal(str_value)
         else:
-            raise ValueError(f'{self.strvar.get()} is not a valid {self.label_text}')
+            raise ValueError(f'{value} is not a valid {self.label_text}')
 
     def set_value(self, value: Union[Decimal, str]):
         """
@@ -642,125 +911,45 @@ class DecimalWidget(EntryWidget):
         """
         if isinstance(value, Decimal):
             self.strvar.set(f'{value:.1f}')
-        elif isinstance(value, str) and value.isnumeric():
-            if len(value.strip()) > 0:
-                re_groups = self.apply_regex()
-                if re_groups is not None:
-                    dec_value: Decimal = Decimal(re_groups[0])
-                    self.strvar.set(f'{dec_value:.1f}')
-                raise ValueError(f'{self.strvar.get()} is not a valid {self.label_text}')
-            else:
+        elif isinstance(value, str):
+            str_value = value.strip()
+            if len(str_value) == 0:
                 self.strvar.set('0.0')
+            elif self._uses_default_regex():
+                if _is_decimal_str(str_value):
+                    self.strvar.set(f'{Decimal(str_value):.1f}')
+                else:
+                    raise ValueError(f'{value} is not a valid {self.label_text}')
+            else:
+                group = self.apply_regex_one(value)
+                if group is not None:
+                    dec_value: Decimal = Decimal(group)
+                    self.strvar.set(f'{dec_value:.1f}')
+                else:
+                    raise ValueError(f'{value} is not a valid {self.label_text}')
         else:
-            raise ValueError(f'{self.strvar.get()} is not a valid {self.label_text}')
-
-
-class LabeledDecimalWidget:
-    def __init__(self, parent, label_text: str, label_width: int, label_grid_args: dict[str, Any],
-                 entry_width: int, entry_grid_args: dict[str, Any],
-                 regex_str: Optional[str] = '\\s*(\\d+[.]*\\d*)\\s*'):
-        """
-        Creates and instance of LabeledDecimalWidget
-
-        :param parent: The GUI parent for this Frame
-        :param label_text: the text to be used in creating the label
-        :type label_text: str
-        :param label_width: the width to be used in creating the label
-        :type label_width: int
-        :param label_grid_args: the arguments to be used in gridding the label
-        :type label_grid_args: dict[str, Any]
-        :param entry_width: the width to be used in creating the entry widget
-        :type entry_width: int
-        :param entry_grid_args: the arguments to be used in gridding the entry widet
-        :type entry_grid_args: dict[str, Any]
-        :param regex_str: the regular expression to be used for validation of input: default value '\\s*(\\d+[.]*\\d*)\\s*'
-        :type regex_str: str
-
-        """
-        # ttkb.Frame.__init__(self, master=parent)
-        row_str: str = 'row'
-        sticky_str: str = 'sticky'
-        anchor = tk.W
-        if row_str in label_grid_args and row_str in entry_grid_args and sticky_str not in entry_grid_args:
-            if label_grid_args[row_str] == entry_grid_args[row_str]:
-                anchor = tk.E
-                entry_grid_args[sticky_str] = tk.W
-        self.label = ttkb.Label(parent, text=label_text, width=label_width, anchor=anchor)
-        self.label.grid(**label_grid_args)
-        self.entry = DecimalWidget(parent=parent, label_text=label_text, regex_str=regex_str)
-        self.entry.grid(**entry_grid_args)
-
-    def focus_set(self):
-        """
-        Delegates calls to focus_set to the entry widget
-
-        :return: None
-
-        """
-        self.entry.focus_set()
-
-    def bind(self, sequence: str | None = ...,
-             func: Callable[[tk.Event], Any] | None = ...,
-             add: Literal["", "+"] | bool | None = ..., ) -> str:
-        """
-        Delegate bind calls to the entry widget
-
-        :param sequence: the name of the event to be bound
-        :type sequence: str | None
-        :param func: the callback to be invoked when the event is captured
-        :type func: Callable[[tk.Event], Any]
-        :param add: allows multiple bindings for single event
-        :type add: Literal["", "+"] | bool | None
-        :return: None
-
-        """
-        return self.entry.bind(sequence, func, add)
-
-    def get_value(self) -> Decimal:
-        """
-        Return the widget's entry value
-
-        :return: the widget's entry value as a Decimal
-        :rtype: decimal.Decimal
-
-        """
-        return self.entry.get_value()
-
-    def set_value(self, value: Union[Decimal, str]) -> None:
-        """
-        The argument value is filtered through the validation regex and the resulting regex group is used to set the
-        widget's entry value
-
-        :param value: the value to be used to set the entry value
-        :type value: Union[decimal.Decimal, str]
-        :return: None
+            raise ValueError(f'{value} is not a valid {self.label_text}')
 
-        """
-        self.entry.set_value(value)
 
-    @staticmethod
-    def label_width(text: str, min_width: int) -> int:
-        """
-        Calculates a width for the label based on the label text and a minumum width
+class LabeledDecimalWidget(_LabeledEntry):
+    """
+    A Label and a DecimalWidget.  The default regular expression is '\\s*(\\d+[.]*\\d*)\\s*'
 
-        :param text: the label test
-        :type text: str
-        :param min_width: the minimum label width
-        :type min_width: int
-        :return: the calculated label width
-        :rtype: int
+    """
+    _ENTRY_CLS = DecimalWidget
 
-        """
-        text_width = len(text) + 2
-        if text_width < min_width:
-            return min_width
-        else:
-            return text_width
 
 class DateWidget(ttkb.Frame):
     """
     A general purpose date entry widget
     """
+    # Maximum day of the month, indexed by month number.  Index 0 is unused.
+    _MAX_DOM: tuple[int, ...] = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    _SEP_FONT: tuple[str, int, str] = ('courier', 20, 'bold')
+    _SEP_FONT_NAME: str = 'ttkb_date_sep'
+    _sep_font: Optional[tkfont.Font] = None
+    _sep_font_tk = None
+
     def __init__(self, parent, default_value: datetime.date = None):
         """
         Creates widgets.DateWidget instance
@@ -774,37 +963,90 @@ class DateWidget(ttkb.Frame):
         self.year_var = ttkb.StringVar()
         self.prev_entry = None
         self.next_entry = None
+        # focus actions for the previous and next entries, set by set_prev_entry and set_next_entry
+        self._focus_prev: Callable[[], None] = _no_focus
+        self._focus_next: Callable[[], None] = _no_focus
         if default_value:
-            self.month_var.set(default_value.month)
-            self.day_var.set(default_value.day)
-            self.year_var.set(default_value.year)
+            self.set_date(default_value)
         self.month_entry = ttkb.Entry(self, textvariable=self.month_var, width=3)
         self.month_entry.grid(column=0, row=0, sticky=tk.NW, ipadx=0, padx=0)
-        ttkb.Label(self, text="/", width=1, font=('courier', 20, 'bold')).grid(column=1, row=0, sticky=tk.NW, padx=0,
-                                                                               pady=5)
-        self.month_entry.bind('<KeyPress>', self.month_keypress)
-        self.month_entry.bind('<FocusIn>', self.clear_key_count)
-        add_validation(self.month_entry, month_validator)
+        self._make_sep(1)
         self.day_entry = ttkb.Entry(self, textvariable=self.day_var, width=3)
         self.day_entry.grid(column=2, row=0, sticky=tk.NW)
-        self.day_entry.bind('<KeyPress>', self.day_keypress)
-        self.day_entry.bind('<FocusIn>', self.clear_key_count)
-        add_validation(self.day_entry, day_validator)
-        ttkb.Label(self, text="/", width=1, font=('courier', 20, 'bold')).grid(column=3, row=0, sticky=tk.NW, padx=0,
-                                                                               pady=5)
+        self._make_sep(3)
         self.year_entry = ttkb.Entry(self, textvariable=self.year_var, width=6)
-        self.year_entry.grid(column=4, row=0, stick=tk.NW)
-        self.year_entry.bind('<KeyPress>', self.year_keypress)
-        self.year_entry.bind('<FocusIn>', self.clear_key_count)
+        self.year_entry.grid(column=4, row=0, sticky=tk.NW)
+        for entry, keypress, entry_validator in ((self.month_entry, self.month_keypress, month_validator),
+                                                 (self.day_entry, self.day_keypress, day_validator),
+                                                 (self.year_entry, self.year_keypress, year_validator)):
+            entry.bind('<KeyPress>', keypress)
+            entry.bind('<FocusIn>', self.clear_key_count)
+            add_validation(entry, entry_validator)
         self.year_entry.bind('<FocusOut>', self.validate_date)
-        add_validation(self.year_entry, year_validator)
         self.grid()
         self.key_count = 0
-        self.max_dom: dict[int, int] = {
-            1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31
-        }
         self.prev_key_press = None
         self.error: bool = False
+        # the field values of the most recent invalid dates, used to avoid repeating the error dialog
+        self._recent_errors: deque[tuple[str, str, str]] = deque(maxlen=3)
+
+    def _make_sep(self, column: int) -> None:
+        """
+        Creates and grids a "/" separator label.  The separator font is registered with Tk as a named font the first
+        time a separator is created, so later separators refer to the font by name instead of having Tk parse the
+        font description again.
+
+        :param column: the grid column for the separator
+        :type column: int
+        :return: None
+
+        """
+        if DateWidget._sep_font_tk is not self.tk:
+            DateWidget._sep_font = tkfont.Font(self, font=self._SEP_FONT, name=self._SEP_FONT_NAME,
+                                               exists=self._SEP_FONT_NAME in tkfont.names(self))
+            DateWidget._sep_font_tk = self.tk
+        ttkb.Label(self, text="/", width=1, font=DateWidget._sep_font).grid(column=column, row=0, sticky=tk.NW,
+                                                                            padx=0, pady=5)
+
+    def _days_in_month(self, month: int, year: int) -> int:
+        """
+        Returns the number of days in a month.  February has 29 days unless a valid year is given and it is not a
+        leap year.
+
+        :param month: the month number, 1 to 12
+        :type month: int
+        :param year: the four digit year, or a negative number if the year is not known
+        :type year: int
+        :return: the number of days in the month
+        :rtype: int
+
+        """
+        if month == 2 and year >= 0 and not calendar.isleap(year):
+            return 28
+        return self._MAX_DOM[month]
+
+    def _max_day(self) -> int:
+        """
+        Returns the number of days in the month entered to the month field, allowing for leap years if a year has
+        been entered.  If the month is not valid, 31 is returned.
+
+        :return: the last day of the month
+        :rtype: int
+
+        """
+        try:
+            month: int = int(self.month_var.get())
+        except ValueError:
+            return 31
+        if not 1 <= month <= 12:
+            return 31
+        try:
+            year: int = int(self.year_var.get())
+        except ValueError:
+            year = -1
+        if 0 <= year < 100:
+            year += 2000
+        return self._days_in_month(month, year)
 
     def set_prev_entry(self, entry) -> None:
         """
@@ -815,6 +1057,10 @@ class DateWidget(ttkb.Frame):
 
         """
         self.prev_entry = entry
+        if entry is not None:
+            self._focus_prev = entry.focus_set
+        else:
+            self._focus_prev = _no_focus
 
     def set_next_entry(self, entry) -> None:
         """
@@ -825,6 +1071,10 @@ class DateWidget(ttkb.Frame):
 
         """
         self.next_entry = entry
+        if entry is not None:
+            self._focus_next = entry.focus_set
+        else:
+            self._focus_next = _no_focus
 
     def focus_set(self) -> None:
         """
@@ -877,6 +1127,106 @@ class DateWidget(ttkb.Frame):
         """
         self.key_count = 0
 
+    def _back_space(self, event) -> None:
+        """
+        Handles the BackSpace key in the month, day and year fields by taking back one counted keystroke
+        :param event:
+        :return: None
+        """
+        if self.key_count > 0:
+            self.key_count -= 1
+
+    def _month_back_tab(self, event) -> None:
+        """
+        Handles the Back Tab key in the month field by putting the previous entry, if any, in focus
+        :param event:
+        :return: None
+        """
+        self.key_count = 0
+        self._focus_prev()
+
+    def _month_up(self, event) -> None:
+        """
+        Handles the Up arrow key in the month field by incrementing the month, wrapping from 12 to 1
+        :param event:
+        :return: None
+        """
+        _step(self.month_var, 1, 12, 1)
+
+    def _month_down(self, event) -> None:
+        """
+        Handles the Down arrow key in the month field by decrementing the month, wrapping from 1 to 12
+        :param event:
+        :return: None
+        """
+        _step(self.month_var, 1, 12, -1)
+
+    def _day_up(self, event) -> None:
+        """
+        Handles the Up arrow key in the day field by incrementing the day, wrapping to 1 after the last day of the
+        month
+        :param event:
+        :return: None
+        """
+        m = int(self.day_var.get())
+        # every month has at least 28 days, so the month is only read near the end of the month
+        if m < 28 or m < self._max_day():
+            self.day_var.set(f'{m + 1:02d}')
+        else:
+            self.day_var.set('01')
+
+    def _day_down(self, event) -> None:
+        """
+        Handles the Down arrow key in the day field by decrementing the day, wrapping from 1 to the last day of the
+        month
+        :param event:
+        :return: None
+        """
+        m = int(self.day_var.get())
+        if m > 1:
+            self.day_var.set(f'{m - 1:02d}')
+        else:
+            self.day_var.set(f'{self._max_day():02d}')
+
+    def _year_tab(self, event) -> None:
+        """
+        Handles the Tab key in the year field by putting the next entry in focus
+        :param event:
+        :return: None
+        """
+        self.key_count = 0
+        self._focus_next()
+
+    def _year_up(self, event) -> None:
+        """
+        Handles the Up arrow key in the year field by incrementing the year
+        :param event:
+        :return: None
+        """
+        m = int(self.year_var.get())
+        self.year_var.set(str(m + 1))
+
+    def _year_down(self, event) -> None:
+        """
+        Handles the Down arrow key in the year field by decrementing the year, stopping at 1
+        :param event:
+        :return: None
+        """
+        m = int(self.year_var.get())
+        if m > 1:
+            self.year_var.set(str(m - 1))
+
+    # Handlers for the non-digit keys of each field, indexed by keysym.  The tables are built once with the class.
+    _MONTH_KEYS: dict[str, Callable[['DateWidget', tk.Event], None]] = {
+        'Tab': clear_key_count, 'ISO_Left_Tab': _month_back_tab, 'BackSpace': _back_space,
+        'Up': _month_up, 'KP_Up': _month_up, 'Down': _month_down, 'KP_Down': _month_down}
+    _DAY_KEYS: dict[str, Callable[['DateWidget', tk.Event], None]] = {
+        'Tab': clear_key_count, 'ISO_Left_Tab': clear_key_count, 'BackSpace': _back_space,
+        'Up': _day_up, 'KP_Up': _day_up, 'Down': _day_down, 'KP_Down': _day_down}
+    _YEAR_KEYS: dict[str, Callable[['DateWidget', tk.Event], None]] = {
+        'Tab': _year_tab, 'ISO_Left_Tab': clear_key_count, 'BackSpace': _back_space,
+        'Up': _year_up, 'KP_Up': _year_up, 'Down': _year_down, 'KP_Down': _year_down}
+
     def month_keypress(self, event):
         """
         Tracks the keystrokes entered to the month field, puts the day entry field in focus after two keystrokes.
@@ -884,7 +1234,7 @@ class DateWidget(ttkb.Frame):
         :param event:
         :return: None
         """
-        if event.char.isnumeric():
+        if event.keysym in _DIGIT_KEYSYMS:
             self.key_count += 1
             if self.key_count == 2:
                 self.key_count = 0
@@ -892,45 +1242,9 @@ class DateWidget(ttkb.Frame):
                 self.day_entry.focus_set()
             self.prev_key_press = None
         else:
-            match event.keysym:
-                case 'Tab':
-                    self.key_count = 0
-                case 'ISO_Left_Tab':
-                    self.key_count = 0
-                    if self.prev_entry is not None:
-                        self.prev_entry.focus_set()
-                case 'BackSpace':
-                    if self.key_count > 0:
-                        self.key_count -= 1
-                case 'Up':
-                    m = int(self.month_var.get())
-                    if m < 12:
-                        self.month_var.set(str(m + 1))
-                    else:
-                        self.month_var.set('01')
-                    self.month_entry.update()
-                case 'KP_Up':
-                    m = int(self.month_var.get())
-                    if m < 12:
-                        self.month_var.set(str(m + 1))
-                    else:
-                        self.month_var.set('01')
-                    self.month_entry.update()
-                case 'Down':
-                    m = int(self.month_var.get())
-                    if m > 1:
-                        self.month_var.set(str(m - 1))
-                    else:
-                        self.month_var.set('12')
-                    self.month_entry.update()
-                case 'KP_Down':
-                    m = int(self.month_var.get())
-                    if m > 1:
-                        self.month_var.set(str(m - 1))
-                    else:
-                        self.month_var.set('12')
-                    self.month_entry.update()
-
+            handler = self._MONTH_KEYS.get(event.keysym)
+            if handler is not None:
+                handler(self, event)
             self.prev_key_press = event.keysym
 
     def day_keypress(self, event):
@@ -940,7 +1254,7 @@ class DateWidget(ttkb.Frame):
         :param event:
         :return: None
         """
-        if event.char.isnumeric():
+        if event.keysym in _DIGIT_KEYSYMS:
             self.key_count += 1
             if self.key_count == 2:
                 self.key_count = 0
@@ -948,43 +1262,9 @@ class DateWidget(ttkb.Frame):
                 self.year_entry.focus_set()
             self.prev_key_press = None
         else:
-            match event.keysym:
-                case 'Tab':
-                    self.key_count = 0
-                case 'ISO_Left_Tab':
-                    self.key_count = 0
-                case 'BackSpace':
-                    if self.key_count > 0:
-                        self.key_count -= 1
-                case 'Up':
-                    m = int(self.day_var.get())
-                    if m < self.max_dom[int(self.month_var.get())]:
-                        self.day_var.set(str(m + 1))
-                    else:
-                        self.day_var.set('01')
-                    self.day_entry.update()
-                case 'KP_Up':
-                    m = int(self.day_var.get())
-                    if m < self.max_dom[int(self.month_var.get())]:
-                        self.day_var.set(str(m + 1))
-                    else:
-                        self.day_var.set('01')
-                    self.day_entry.update()
-                case 'Down':
-                    m = int(self.day_var.get())
-                    if m > 1:
-                        self.day_var.set(str(m - 1))
-                    else:
-                        self.day_var.set(str(self.max_dom[int(self.month_var.get())]))
-                    self.day_entry.update()
-                case 'KP_Down':
-                    m = int(self.day_var.get())
-                    if m > 1:
-                        self.day_var.set(str(m - 1))
-                    else:
-                        self.day_var.set(str(self.max_dom[int(self.month_var.get())]))
-                    self.day_entry.update()
-
+            handler = self._DAY_KEYS.get(event.keysym)
+            if handler is not None:
+                handler(self, event)
             self.prev_key_press = event.keysym
 
     def year_keypress(self, event):
@@ -994,41 +1274,16 @@ class DateWidget(ttkb.Frame):
         :param event:
         :return: None
         """
-        if event.char.isnumeric():
+        if event.keysym in _DIGIT_KEYSYMS:
             self.key_count += 1
             if self.key_count == 4:
                 self.key_count = 0
-                self.next_entry.focus_set()
+                self._focus_next()
             self.prev_key_press = None
         else:
-            match event.keysym:
-                case 'Tab':
-                    self.key_count = 0
-                    self.next_entry.focus_set()
-                case 'ISO_Left_Tab':
-                    self.key_count = 0
-                case 'BackSpace':
-                    if self.key_count > 0:
-                        self.key_count -= 1
-                case 'Up':
-                    m = int(self.year_var.get())
-                    self.year_var.set(str(m + 1))
-                    self.year_entry.update()
-                case 'KP_Up':
-                    m = int(self.year_var.get())
-                    self.year_var.set(str(m + 1))
-                    self.year_entry.update()
-                case 'Down':
-                    m = int(self.year_var.get())
-                    if m > 0:
-                        self.year_var.set(str(m - 1))
-                        self.year_entry.update()
-                case 'KP_Down':
-                    m = int(self.year_var.get())
-                    if m > 1:
-                        self.year_var.set(str(m - 1))
-                        self.year_entry.update()
-
+            handler = self._YEAR_KEYS.get(event.keysym)
+            if handler is not None:
+                handler(self, event)
             self.prev_key_press = event.keysym
 
     def validate_date(self, event):
@@ -1039,53 +1294,50 @@ class DateWidget(ttkb.Frame):
         :return: None
         """
         if self.prev_key_press != 'ISO_Left_Tab':
+            month_s: str = self.month_var.get()
+            day_s: str = self.day_var.get()
+            year_s: str = self.year_var.get()
             valid = True
-            if self.month_var.get().isnumeric():
-                month: int = int(self.month_var.get())
-                if not 1 <= month <= 12:
-                    self.month_var.set('')
-                    self.month_entry.update()
-                    self.month_entry.focus_set()
-                    valid = False
-                if valid:
-                    if self.day_var.get().isnumeric():
-                        try:
-                            day: int = int(self.day_var.get())
-                            if not 1 <= day <= self.max_dom[month]:
-                                self.day_var.set('')
-                                self.day_entry.update()
-                                self.day_entry.focus_set()
-                                valid = False
-                        except KeyError:
-                            # This should never happen, as the month has already been validated
-                            pass
-                        if valid and not self.year_var.get().isnumeric():
-                            self.year_var.set('')
-                            self.year_entry.update()
-                            self.year_entry.focus_set()
-                            valid = False
-                    else:
-                        # If the day is not numeric
-                        self.day_var.set('')
-                        self.day_entry.update()
-                        self.day_entry.focus_set()
-                        valid = False
-            else:
-                # If the month is not numeric
+            try:
+                month: int = int(month_s)
+            except ValueError:
+                month = 0
+            if not 1 <= month <= 12:
                 self.month_var.set('')
-                self.month_entry.update()
                 self.month_entry.focus_set()
                 valid = False
-            if valid and int(self.year_var.get()) < 100:
-                year = 2000 + int(self.year_var.get())
+            else:
+                try:
+                    day: int = int(day_s)
+                except ValueError:
+                    day = 0
+                try:
+                    year: int = int(year_s)
+                except ValueError:
+                    year = -1
+                two_digit_year: bool = 0 <= year < 100
+                if two_digit_year:
+                    year += 2000
+                if not 1 <= day <= self._days_in_month(month, year):
+                    self.day_var.set('')
+                    self.day_entry.focus_set()
+                    valid = False
+                elif year < 0:
+                    self.year_var.set('')
+                    self.year_entry.focus_set()
+                    valid = False
+            if valid and two_digit_year:
                 self.year_var.set(f'{year:4d}')
-                self.year_entry.update()
+                self.year_entry.update_idletasks()
             if valid:
-                self.next_entry.focus_set()
+                self._focus_next()
                 self.error = False
+                self._recent_errors.clear()
             else:
-                if not self.error:
-                    self.error = True
+                self.error = True
+                signature = (month_s, day_s, year_s)
+                if signature not in self._recent_errors:
+                    self._recent_errors.append(signature)
                     dialogs.Messagebox.ok("Date entered is not valid.", "Date Entry Error")
 
     def get_date(self) -> date:
@@ -1109,8 +1361,8 @@ class DateWidget(ttkb.Frame):
         :return: None
 
         """
-        self.month_var.set(str(date_value.month))
-        self.day_var.set(str(date_value.day))
+        self.month_var.set(f'{date_value.month:02d}')
+        self.day_var.set(f'{date_value.day:02d}')
         self.year_var.set(str(date_value.year))
 
 
@@ -1135,11 +1387,11 @@ class TimeWidget(ttkb.Frame):
         self.ampm_var = ttkb.StringVar()
         self.prev_entry = None
         self.next_entry = None
+        # focus actions for the previous and next entries, set by set_prev_entry and set_next_entry
+        self._focus_prev: Callable[[], None] = _no_focus
+        self._focus_next: Callable[[], None] = _no_focus
         if default_value is not None:
-            fmt_time = default_value.strftime('%I:%M %p')
-            self.hour_var.set(fmt_time[0:2])
-            self.minute_var.set(fmt_time[3:5])
-            self.ampm_var.set(fmt_time[6:8])
+            self.set_time(default_value)
         self.hour_entry = ttkb.Entry(self, textvariable=self.hour_var, width=3)
         self.hour_entry.grid(column=0, row=0, sticky=tk.W, ipadx=0, padx=0, pady=5)
         ttkb.Label(self, text=":", width=1, font=('courier', 20, 'bold')).grid(column=1, row=0, sticky=tk.NW, padx=0,
@@ -1152,6 +1404,9 @@ class TimeWidget(ttkb.Frame):
         self.minute_entry.bind('<KeyPress>', self.minute_keypress)
         self.minute_entry.bind('<FocusIn>', self.clear_key_count)
         add_validation(self.minute_entry, minute_validator)
+        # the variable, entry and range of each field checked by validate_time, in the order they are checked
+        self._time_fields: tuple[tuple[ttkb.StringVar, ttkb.Entry, int, int], ...] = (
+            (self.hour_var, self.hour_entry, 1, 12), (self.minute_var, self.minute_entry, 0, 59))
         self.am_button = Radiobutton(self, text='AM', value='AM', variable=self.ampm_var, command=self.validate_time)
         self.am_button.grid(column=3, row=0, stick=tk.W, padx=5, pady=5)
         self.pm_button = Radiobutton(self, text='PM', value='PM', variable=self.ampm_var, command=self.validate_time)
@@ -1163,6 +1418,8 @@ class TimeWidget(ttkb.Frame):
         self.key_count = 0
         self.prev_key_press = None
         self.error: bool = False
+        # the field values of the most recent invalid times, used to avoid repeating the error dialog
+        self._recent_errors: deque[tuple[str, ...]] = deque(maxlen=3)
 
     def disable(self) -> None:
         """
@@ -1197,6 +1454,13 @@ class TimeWidget(ttkb.Frame):
 
         """
         self.prev_entry = entry
+        if entry is not None:
+            def focus_prev() -> None:
+                entry.select_range(0, END)
+                entry.focus_set()
+            self._focus_prev = focus_prev
+        else:
+            self._focus_prev = _no_focus
 
     def set_next_entry(self, entry):
         """
@@ -1207,6 +1471,10 @@ class TimeWidget(ttkb.Frame):
 
         """
         self.next_entry = entry
+        if entry is not None:
+            self._focus_next = entry.focus_set
+        else:
+            self._focus_next = _no_focus
 
     def focus_set(self) -> None:
         """
@@ -1238,6 +1506,65 @@ class TimeWidget(ttkb.Frame):
         """
         self.key_count = 0
 
+    def _back_space(self, event) -> None:
+        """
+        Handles the BackSpace key in the hour and minute fields by taking back one counted keystroke
+        :param event:
+        :return: None
+        """
+        if self.key_count > 0:
+            self.key_count -= 1
+
+    def _hour_back_tab(self, event) -> None:
+        """
+        Handles the Back Tab key in the hour field by selecting the contents of the previous entry, if any, and
+        putting it in focus
+        :param event:
+        :return: None
+        """
+        self.key_count = 0
+        self._focus_prev()
+
+    def _hour_up(self, event) -> None:
+        """
+        Handles the Up arrow key in the hour field by incrementing the hour, wrapping from 12 to 1
+        :param event:
+        :return: None
+        """
+        _step(self.hour_var, 1, 12, 1)
+
+    def _hour_down(self, event) -> None:
+        """
+        Handles the Down arrow key in the hour field by decrementing the hour, wrapping from 1 to 12
+        :param event:
+        :return: None
+        """
+        _step(self.hour_var, 1, 12, -1)
+
+    def _minute_up(self, event) -> None:
+        """
+        Handles the Up arrow key in the minute field by incrementing the minute, wrapping from 59 to 0
+        :param event:
+        :return: None
+        """
+        _step(self.minute_var, 0, 59, 1)
+
+    def _minute_down(self, event) -> None:
+        """
+        Handles the Down arrow key in the minute field by decrementing the minute, wrapping from 0 to 59
+        :param event:
+        :return: None
+        """
+        _step(self.minute_var, 0, 59, -1)
+
+    # Handlers for the non-digit keys of each field, indexed by keysym.  The tables are built once with the class.
+    _HOUR_KEYS: dict[str, Callable[['TimeWidget', tk.Event], None]] = {
+        'Tab': clear_key_count, 'ISO_Left_Tab': _hour_back_tab, 'BackSpace': _back_space,
+        'Up': _hour_up, 'KP_Up': _hour_up, 'Down': _hour_down, 'KP_Down': _hour_down}
+    _MINUTE_KEYS: dict[str, Callable[['TimeWidget', tk.Event], None]] = {
+        'Tab': clear_key_count, 'ISO_Left_Tab': clear_key_count, 'BackSpace': _back_space,
+        'Up': _minute_up, 'KP_Up': _minute_up, 'Down': _minute_down, 'KP_Down': _minute_down}
+
     def hour_keypress(self, event):
         """
         Tracks the keystrokes entered to the hour field, puts the minute entry field on the GUI in focus after two
@@ -1245,7 +1572,7 @@ class TimeWidget(ttkb.Frame):
         :param event:
         :return: None
         """
-        if event.char.isnumeric():
+        if event.keysym in _DIGIT_KEYSYMS:
             self.key_count += 1
             if self.key_count == 2:
                 self.key_count = 0
@@ -1253,46 +1580,9 @@ class TimeWidget(ttkb.Frame):
                 self.minute_entry.focus_set()
             self.prev_key_press = None
         else:
-            match event.keysym:
-                case 'Tab':
-                    self.key_count = 0
-                case 'ISO_Left_Tab':
-                    self.key_count = 0
-                    if self.prev_entry is not None:
-                        self.prev_entry.select_range(0, END)
-                        self.prev_entry.focus_set()
-                case 'BackSpace':
-                    if self.key_count > 0:
-                        self.key_count -= 1
-                case 'Up':
-                    h = int(self.hour_var.get())
-                    if h < 12:
-                        self.hour_var.set(str(h + 1))
-                    else:
-                        self.hour_var.set('01')
-                    self.hour_entry.update()
-                case 'KP_Up':
-                    h = int(self.hour_var.get())
-                    if h < 12:
-                        self.hour_var.set(str(h + 1))
-                    else:
-                        self.hour_var.set('01')
-                    self.hour_entry.update()
-                case 'Down':
-                    h = int(self.hour_var.get())
-                    if h > 1:
-                        self.hour_var.set(str(h - 1))
-                    else:
-                        self.hour_var.set('12')
-                    self.hour_entry.update()
-                case 'KP_Down':
-                    h = int(self.hour_var.get())
-                    if h > 1:
-                        self.hour_var.set(str(h - 1))
-                    else:
-                        self.hour_var.set('12')
-                    self.hour_entry.update()
-
+            handler = self._HOUR_KEYS.get(event.keysym)
+            if handler is not None:
+                handler(self, event)
             self.prev_key_press = event.keysym
 
     def minute_keypress(self, event):
@@ -1302,51 +1592,16 @@ class TimeWidget(ttkb.Frame):
         :param event:
         :return: None
         """
-        if event.char.isnumeric():
+        if event.keysym in _DIGIT_KEYSYMS:
             self.key_count += 1
             if self.key_count == 2:
                 self.key_count = 0
                 self.am_button.focus_set()
             self.prev_key_press = None
         else:
-            match event.keysym:
-                case 'Tab':
-                    self.key_count = 0
-                case 'ISO_Left_Tab':
-                    self.key_count = 0
-                case 'BackSpace':
-                    if self.key_count > 0:
-                        self.key_count -= 1
-                case 'Up':
-                    m = int(self.minute_var.get())
-                    if m < 59:
-                        self.minute_var.set(str(m + 1))
-                        self.minute_entry.update()
-                    else:
-                        self.minute_var.set('00')
-                case 'KP_Up':
-                    m = int(self.minute_var.get())
-                    if m < 59:
-                        self.minute_var.set(str(m + 1))
-                    else:
-                        self.minute_var.set('00')
-                    self.minute_entry.update()
-                case 'Down':
-                    m = int(self.minute_var.get())
-                    if m > 1:
-                        self.minute_var.set(str(m - 1))
-                    else:
-                        self.minute_var.set('59')
-                    self.minute_entry.update()
-                case 'KP_Down':
-                    m = int(self.minute_var.get())
-                    if m > 1:
-                        self.minute_var.set(str(m - 1))
-                    else:
-                        self.minute_var.set('59')
-                    self.minute_entry.update()
-
-
+            handler = self._MINUTE_KEYS.get(event.keysym)
+            if handler is not None:
+                handler(self, event)
             self.prev_key_press = event.keysym
 
     def am_keypress(self, event):
@@ -1356,8 +1611,8 @@ class TimeWidget(ttkb.Frame):
         :param event:
         :return: None
         """
-        if event.keysym == 'Tab' and self.next_entry is not None:
-            self.next_entry.focus_set()
+        if event.keysym == 'Tab':
+            self._focus_next()
 
     def validate_time(self, event=None):
         """
@@ -1367,40 +1622,28 @@ class TimeWidget(ttkb.Frame):
         :return: None
         """
         if self.prev_key_press != 'ISO_Left_Tab':
+            values: tuple[str, ...] = tuple(var.get() for var, entry, low, high in self._time_fields)
             valid = True
-            if self.hour_entry.get().isnumeric():
-                hour = int(self.hour_var.get())
-                if not 1 <= hour <= 12:
-                    self.hour_var.set('')
-                    self.hour_entry.select_range(0, END)
-                    self.hour_entry.focus_set()
+            for value_s, (var, entry, low, high) in zip(values, self._time_fields):
+                try:
+                    value: int = int(value_s)
+                except ValueError:
+                    value = low - 1
+                if not low <= value <= high:
+                    var.set('')
+                    entry.select_range(0, END)
+                    entry.focus_set()
                     valid = False
-                if valid:
-                    if self.minute_entry.get().isnumeric():
-                        minute = int(self.minute_var.get())
-                        if not 0 <= minute <= 60:
-                            self.minute_var.set('')
-                            self.minute_entry.select_range(0, END)
-                            self.minute_entry.focus_set()
-                            valid = False
-                    else:
-                        self.minute_var.set('')
-                        self.minute_entry.select_range(0, END)
-                        self.minute_entry.focus_set()
-                        valid = False
-            else:
-                self.hour_var.set('')
-                self.hour_entry.select_range(0, END)
-                self.hour_entry.focus_set()
-                valid = False
+                    break
             if valid:
-                if self.next_entry is not None:
-                    self.next_entry.focus_set()
+                self._focus_next()
                 self.error = False
+                self._recent_errors.clear()
             else:
-                if not self.error:
+                self.error = True
+                if values not in self._recent_errors:
+                    self._recent_errors.append(values)
                     dialogs.Messagebox.ok("Time entered is not valid.", "Time Entry Error")
-                    self.error = True
 
     def get_time(self) -> Optional[time]:
         """
@@ -1413,21 +1656,24 @@ class TimeWidget(ttkb.Frame):
             hour: int = int(self.hour_var.get())
             minute: int = int(self.minute_var.get())
             ampm: str = self.ampm_var.get()
+            hour %= 12
             if ampm == "PM":
-                if hour < 12:
-                    hour += 12
+                hour += 12
             return time(hour=hour, minute=minute)
 
-    def get_datetime(self):
+    def get_datetime(self) -> Optional[datetime]:
         """
         Returns a datetime instance with a zero date.
 
-        :return: datetime instance
-        :rtype: datetime
+        :return: datetime instance, or None if the hour or minute is blank
+        :rtype: Optional[datetime]
 
         """
+        time_value = self.get_time()
+        if time_value is None:
+            return None
         dummy = date(year=2022, month=10, day=23)
-        return utilities.mk_datetime(dummy, self.get_time())
+        return datetime.combine(dummy, time_value)
 
     def set_time(self, time_value: time) -> None:
         """
@@ -1439,17 +1685,23 @@ class TimeWidget(ttkb.Frame):
 
         """
         hour: int = time_value.hour
-        minute: int = time_value.minute
-        ampm: str = 'AM'
         if hour >= 12:
-            hour -= 12
-            ampm = 'PM'
-        self.hour_var.set(str(hour))
-        self.minute_var.set(str(minute))
+            ampm: str = 'PM'
+        else:
+            ampm = 'AM'
+        self.hour_var.set(f'{hour % 12 or 12:02d}')
+        self.minute_var.set(f'{time_value.minute:02d}')
         self.ampm_var.set(ampm)
 
     def set_datetime(self, dt_value: datetime):
-        dt, tm = utilities.split_datetime(dt_value)
-        self.set_time(tm)
+        """
+        Set the hour, minute and am/pm fields to the time of the provided datetime
+
+        :param dt_value: the datetime whose time is to be used
+        :type dt_value: datetime
+        :return: None
+
+        """
+        self.set_time(dt_value.time())
 
 